@@ -0,0 +1,90 @@
+"""
+Compare encode time and bytes on the wire for `LibroViewSet` list payloads.
+
+    python benchmarks/bench_renderers.py [--rows 1000 10000] [--repeat 5]
+
+Rows are shaped like `LibroSerializer` output (one nested author each) so no
+database is needed.
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "myproject.settings_dev")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from myapp.renderers import MessagePackRenderer  # noqa: E402
+
+# Same level django.utils.text.compress_string (and so the middleware) uses.
+GZIP_LEVEL = 6
+
+
+def make_rows(n):
+    return [
+        {
+            "id": i,
+            "autores": [
+                {
+                    "id": i % 500,
+                    "nombre": "Gabriel",
+                    "apellido": "García Márquez",
+                    "fecha_nacimiento": "1927-03-06",
+                    "biografia": "Escritor colombiano, premio Nobel de Literatura",
+                }
+            ],
+            "titulo": f"Cien años de soledad, volumen {i}",
+            "fecha_publicacion": "1967-05-30",
+            "isbn": f"{9780000000000 + i}",
+            "descripcion": "Una obra maestra de la literatura latinoamericana",
+            "paginas": 100 + i % 900,
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    renderers = [("json", JSONRenderer()), ("msgpack", MessagePackRenderer())]
+    print(f"{'rows':>7} {'format':<13} {'encode ms':>10} {'bytes':>10}")
+    for n in args.rows:
+        rows = make_rows(n)
+        for name, renderer in renderers:
+            body = renderer.render(rows)
+            best = min(
+                timeit.repeat(
+                    lambda: renderer.render(rows), number=1, repeat=args.repeat
+                )
+            )
+            print(f"{n:>7} {name:<13} {best * 1000:>10.2f} {len(body):>10}")
+
+            gz_body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            gz_best = min(
+                timeit.repeat(
+                    lambda: gzip.compress(
+                        renderer.render(rows), compresslevel=GZIP_LEVEL
+                    ),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            print(
+                f"{n:>7} {name + '+gzip':<13} {gz_best * 1000:>10.2f} {len(gz_body):>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Sustained write throughput for `LibroViewSet`: one POST per row versus
+`POST /api/libros/bulk/` batches.
+
+    python benchmarks/bench_writes.py [--rows 5000] [--batch 500]
+
+Runs against a throwaway test database created from the selected settings
+(`myproject.settings_dev` by default, i.e. in-memory SQLite).
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "myproject.settings_dev")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from myapp.models import Libro  # noqa: E402
+
+
+def make_rows(start, n):
+    return [
+        {
+            "titulo": f"Cien años de soledad, volumen {i}",
+            "fecha_publicacion": "1967-05-30",
+            "isbn": f"{9780000000000 + i}",
+            "descripcion": "Una obra maestra de la literatura latinoamericana",
+            "paginas": 100 + i % 900,
+        }
+        for i in range(start, start + n)
+    ]
+
+
+class QueryCounter:
+    # Unlike CaptureQueriesContext, not capped by Django's 9000-entry query log.
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def run(label, rows, send):
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        started = time.perf_counter()
+        send(rows)
+        elapsed = time.perf_counter() - started
+    print(
+        f"{label:<22} {len(rows):>7} rows {elapsed:>8.2f} s "
+        f"{len(rows) / elapsed:>10.0f} rows/s "
+        f"{counter.count / len(rows):>6.2f} queries/row"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    client = APIClient()
+
+    def single(rows):
+        url = reverse("libro-list")
+        for row in rows:
+            assert client.post(url, row, format="json").status_code == 201
+
+    def bulk(rows):
+        url = reverse("libro-bulk")
+        for i in range(0, len(rows), args.batch):
+            batch = rows[i : i + args.batch]
+            assert client.post(url, batch, format="json").status_code == 201
+
+    try:
+        run("POST /libros/", make_rows(0, args.rows), single)
+        run(f"POST /libros/bulk/ x{args.batch}", make_rows(args.rows, args.rows), bulk)
+        assert Libro.objects.count() == 2 * args.rows
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Compare gunicorn worker modes (threaded WSGI vs uvicorn ASGI) on this
+project's endpoints using gunicorn.conf.py.
+
+    python manage.py migrate --settings=myproject.settings_dev
+    python manage.py seed_catalogue --settings=myproject.settings_dev
+    python benchmarks/load_test.py [--requests 2000] [--concurrency 16] [--path /api/...]
+
+Each mode is started on a free local port, warmed up, then hit with
+``--requests`` GETs spread over ``--concurrency`` keep-alive clients per path.
+Default paths use ids and a change feed ``since`` read from the database. A
+path that answers with an error aborts the run; errors during the load are
+left out of the latency stats and make the script exit non-zero.
+"""
+
+import argparse
+import http.client
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MODES = {
+    "gthread": "gthread",
+    "uvicorn": "uvicorn.workers.UvicornWorker",
+}
+
+
+def default_paths(settings):
+    os.environ["DJANGO_SETTINGS_MODULE"] = settings
+    sys.path.insert(0, str(BASE_DIR))
+    import django
+
+    django.setup()
+    from django.db import connections
+    from django.db.models import Max
+
+    from myapp.models import Autor, Cambio, Compactacion, Libro
+
+    autor = Autor.objects.order_by("id").values_list("id", flat=True).first()
+    libro = Libro.objects.order_by("id").values_list("id", flat=True).first()
+    if autor is None or libro is None:
+        sys.exit("No data to load-test; run `manage.py seed_catalogue` first.")
+    # Last ~100 changes, but never before the compaction horizon (410).
+    last = Cambio.objects.aggregate(seq=Max("seq"))["seq"] or 0
+    horizonte = Compactacion.objects.aggregate(hasta=Max("hasta"))["hasta"] or 0
+    since = max(last - 100, horizonte)
+    connections.close_all()
+    return [
+        f"/api/autors/{autor}/",
+        f"/api/libros/{libro}/",
+        f"/api/changes/?since={since}&limit=100",
+    ]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, path, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", path, headers={"Accept": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"gunicorn did not answer on port {port} within {timeout}s")
+
+
+def client(port, path, count):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    latencies, errors = [], 0
+    for _ in range(count):
+        started = time.perf_counter()
+        conn.request("GET", path, headers={"Accept": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        if response.status >= 400:
+            errors += 1
+        else:
+            latencies.append(time.perf_counter() - started)
+        if response.will_close:
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    conn.close()
+    return latencies, errors
+
+
+def hammer(port, path, requests, concurrency):
+    per_client = max(requests // concurrency, 1)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(
+            pool.map(lambda _: client(port, path, per_client), range(concurrency))
+        )
+    elapsed = time.perf_counter() - started
+    latencies = sorted(lat for lats, _ in results for lat in lats)
+    errors = sum(errs for _, errs in results)
+    if len(latencies) < 2:
+        return 0.0, float("nan"), float("nan"), float("nan"), errors
+    quantiles = statistics.quantiles(latencies, n=100)
+    return len(latencies) / elapsed, quantiles[49], quantiles[94], quantiles[98], errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--mode", action="append", dest="modes", choices=MODES)
+    parser.add_argument("--settings", default="myproject.settings_dev")
+    args = parser.parse_args()
+    paths = args.paths or default_paths(args.settings)
+    failed = False
+
+    print(
+        f"{'mode':<8} {'path':<36} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}"
+    )
+    for mode in args.modes or list(MODES):
+        port = free_port()
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": args.settings,
+            "GUNICORN_WORKER_CLASS": MODES[mode],
+            "GUNICORN_BIND": f"127.0.0.1:{port}",
+            "GUNICORN_LOGLEVEL": "warning",
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"],
+            cwd=BASE_DIR,
+            env=env,
+        )
+        try:
+            for path in paths:
+                status = wait_ready(port, path)
+                if status >= 400:
+                    sys.exit(
+                        f"{mode}: GET {path} returned {status}; fix the path or data."
+                    )
+                hammer(port, path, args.concurrency * 10, args.concurrency)  # warm up
+                rps, p50, p95, p99, errors = hammer(
+                    port, path, args.requests, args.concurrency
+                )
+                print(
+                    f"{mode:<8} {path:<36} {rps:>8.0f} {p50 * 1000:>8.1f} "
+                    f"{p95 * 1000:>8.1f} {p99 * 1000:>8.1f} {errors:>6}"
+                )
+                failed = failed or errors > 0
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+    if failed:
+        sys.exit("Some requests failed; their latencies were excluded above.")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,4 +11,5 @@ python manage.py collectstatic --no-input
 # Apply any outstanding database migrations
 python manage.py migrate
 
-# python -m gunicorn myproject.asgi:application -k uvicorn.workers.UvicornWorker
\ No newline at end of file
+# Start command (worker sizing and mode are read from gunicorn.conf.py / env):
+# python -m gunicorn
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Gunicorn configuration, picked up automatically by running ``gunicorn`` from
+the project root. Every knob can be overridden through the environment.
+
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import os
+
+ASGI_WORKER = "uvicorn.workers.UvicornWorker"
+
+
+def _env(name, default):
+    # Blank values count as unset. WEB_CONCURRENCY is the exception: gunicorn
+    # parses it itself on import, so it must be unset rather than blank.
+    return os.environ.get(name) or default
+
+
+def _cpu_count():
+    # Respect CPU affinity/cgroup pinning where the platform exposes it.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# `uvicorn.workers.UvicornWorker` (ASGI) or `gthread` (threaded WSGI).
+worker_class = _env("GUNICORN_WORKER_CLASS", ASGI_WORKER)
+wsgi_app = _env(
+    "GUNICORN_APP",
+    (
+        "myproject.asgi:application"
+        if worker_class == ASGI_WORKER
+        else "myproject.wsgi:application"
+    ),
+)
+
+bind = _env("GUNICORN_BIND", f"0.0.0.0:{_env('PORT', '8000')}")
+workers = int(_env("WEB_CONCURRENCY", _cpu_count() * 2 + 1))
+# Only used by the gthread worker.
+threads = int(_env("GUNICORN_THREADS", 4))
+
+# Import Django once in the master so workers share its memory copy-on-write.
+preload_app = _env("GUNICORN_PRELOAD", "True") == "True"
+
+# Recycle workers to cap memory growth; jitter keeps them from restarting together.
+max_requests = int(_env("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(_env("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10))
+
+timeout = int(_env("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(_env("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(_env("GUNICORN_KEEPALIVE", 5))
+
+accesslog = _env("GUNICORN_ACCESSLOG", None)
+errorlog = "-"
+loglevel = _env("GUNICORN_LOGLEVEL", "info")
+
+
+def pre_fork(server, worker):
+    # A connection opened while preloading would be inherited by every worker
+    # and shared over one socket; close it in the master before forking.
+    # Closing it in the child instead would also tear down the parent's end.
+    from django.apps import apps
+
+    if apps.ready:
+        from django.db import connections
+
+        connections.close_all()
+
+    # Move preloaded objects out of the GC's reach so collections in the
+    # workers don't touch (and so copy) the shared pages.
+    gc.freeze()
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Autor, Libro
+from .models import Autor, Cambio, Libro
 
 
 @admin.register(Autor)
@@ -16,3 +16,19 @@ class LibroAdmin(admin.ModelAdmin):
     search_fields = ("titulo", "isbn")
     list_filter = ("fecha_publicacion", "autores")
     filter_horizontal = ("autores",)
+
+
+@admin.register(Cambio)
+class CambioAdmin(admin.ModelAdmin):
+    list_display = ("seq", "accion", "modelo", "objeto_id", "relacionado_id", "fecha")
+    list_filter = ("modelo", "accion")
+
+    # The log is append-only; compact_changes is the only thing that prunes it.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
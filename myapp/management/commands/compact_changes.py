@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef
+from django.utils import timezone
+
+from myapp.models import Cambio, Compactacion
+
+
+class Command(BaseCommand):
+    help = (
+        "Compact the change log: among entries older than --retention-days, drop those "
+        "superseded by a newer entry for the same row and then the remaining tombstones. "
+        "Clients whose `since` predates a dropped tombstone get a 410 and must resync."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=30,
+            help="Keep every entry newer than this.",
+        )
+
+    def handle(self, *args, **options):
+        if options["retention_days"] < 0:
+            raise CommandError("--retention-days must not be negative.")
+        cutoff = timezone.now() - timedelta(days=options["retention_days"])
+
+        with transaction.atomic():
+            horizonte = Cambio.objects.filter(fecha__lt=cutoff).aggregate(
+                seq=Max("seq")
+            )["seq"]
+            if horizonte is None:
+                self.stdout.write("Nothing to compact.")
+                return
+            antiguos = Cambio.objects.filter(seq__lte=horizonte)
+
+            # Rows are keyed by (modelo, objeto_id), links also by relacionado_id.
+            newer = Cambio.objects.filter(
+                modelo=OuterRef("modelo"),
+                objeto_id=OuterRef("objeto_id"),
+                seq__gt=OuterRef("seq"),
+            )
+            superados, _ = antiguos.filter(
+                Exists(newer.filter(relacionado_id__isnull=True))
+                | Exists(newer.filter(relacionado_id=OuterRef("relacionado_id")))
+            ).delete()
+
+            tombstones = antiguos.filter(accion=Cambio.Accion.DELETE)
+            # Links of a deleted libro/autor are removed by cascade without a
+            # log entry of their own, so nothing supersedes them; drop them
+            # together with the tombstone that implies their removal.
+            borrado = tombstones.filter(seq__gt=OuterRef("seq"))
+            huerfanos, _ = antiguos.filter(
+                Exists(
+                    borrado.filter(
+                        modelo=Cambio.Modelo.LIBRO, objeto_id=OuterRef("objeto_id")
+                    )
+                )
+                | Exists(
+                    borrado.filter(
+                        modelo=Cambio.Modelo.AUTOR, objeto_id=OuterRef("relacionado_id")
+                    )
+                ),
+                modelo=Cambio.Modelo.LIBRO_AUTOR,
+            ).delete()
+
+            hasta = tombstones.aggregate(seq=Max("seq"))["seq"]
+            borrados = 0
+            if hasta is not None:
+                borrados, _ = tombstones.delete()
+                Compactacion.objects.create(hasta=hasta)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Removed {superados} superseded entries, {huerfanos} links of "
+                f"deleted rows and {borrados} tombstones up to #{horizonte}."
+            )
+        )
@@ -0,0 +1,204 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from myapp.models import Autor, Cambio, Libro
+from myapp.signals import registrar_creados, registrar_enlaces
+
+NOMBRES = [
+    "Gabriel",
+    "Isabel",
+    "Julio",
+    "Laura",
+    "Jorge",
+    "Elena",
+    "Mario",
+    "Rosa",
+    "Pablo",
+    "Carmen",
+    "Octavio",
+    "Clarice",
+    "Juan",
+    "Alfonsina",
+    "Miguel",
+    "Teresa",
+]
+APELLIDOS = [
+    "García",
+    "Allende",
+    "Cortázar",
+    "Esquivel",
+    "Borges",
+    "Poniatowska",
+    "Vargas",
+    "Montero",
+    "Neruda",
+    "Laforet",
+    "Paz",
+    "Lispector",
+    "Rulfo",
+    "Storni",
+    "Unamuno",
+]
+PALABRAS = [
+    "soledad",
+    "amor",
+    "tiempo",
+    "casa",
+    "espíritus",
+    "laberinto",
+    "ciudad",
+    "perros",
+    "río",
+    "noche",
+    "memoria",
+    "viento",
+    "sombra",
+    "jardín",
+    "mar",
+    "silencio",
+]
+ISBN_PREFIX = "979"
+EPOCH = date(1500, 1, 1)
+DAYS = (date(2024, 12, 31) - EPOCH).days
+
+
+def isbn13(prefix, serial):
+    """Return a valid ISBN-13 made of ``prefix``, a zero-padded ``serial`` and its check digit."""
+    body = f"{prefix}{serial:0{12 - len(prefix)}d}"
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(body))
+    return f"{body}{(10 - total % 10) % 10}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed the database with synthetic Autor/Libro rows using chunked bulk_create. "
+        "The same --seed always produces the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--autores", type=int, default=1000, help="Authors to create."
+        )
+        parser.add_argument(
+            "--libros", type=int, default=10000, help="Books to create."
+        )
+        parser.add_argument(
+            "--fanout",
+            type=int,
+            default=3,
+            help="Maximum authors per book (at least one).",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10000,
+            help="Rows per bulk_create/transaction.",
+        )
+        parser.add_argument(
+            "--skip-changes",
+            action="store_true",
+            help="Don't write change feed entries (replicas won't see the seeded rows).",
+        )
+
+    def handle(self, *args, **options):
+        for name in ("autores", "libros", "fanout"):
+            if options[name] < 0:
+                raise CommandError(f"--{name} must not be negative.")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        rng = random.Random(options["seed"])
+        chunk_size = options["chunk_size"]
+        self.log_changes = not options["skip_changes"]
+        started = time.perf_counter()
+
+        autor_ids = self.seed_autores(rng, options["autores"], chunk_size)
+        if not autor_ids:
+            autor_ids = list(Autor.objects.values_list("id", flat=True))
+        if options["libros"] and options["fanout"] and not autor_ids:
+            raise CommandError(
+                "No authors to link books to; pass --autores or --fanout 0."
+            )
+
+        libros, enlaces = self.seed_libros(
+            rng, options["libros"], options["fanout"], autor_ids, chunk_size
+        )
+
+        elapsed = time.perf_counter() - started
+        rate = (options["autores"] + libros + enlaces) / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {options['autores']} autores, {libros} libros and {enlaces} "
+                f"libro-autor links in {elapsed:.2f}s ({rate:.0f} rows/s)."
+            )
+        )
+
+    def seed_autores(self, rng, count, chunk_size):
+        ids = []
+        for start in range(0, count, chunk_size):
+            autores = [
+                Autor(
+                    nombre=rng.choice(NOMBRES),
+                    apellido=f"{rng.choice(APELLIDOS)} {rng.choice(APELLIDOS)}",
+                    fecha_nacimiento=EPOCH + timedelta(days=rng.randrange(DAYS)),
+                    biografia=" ".join(rng.choices(PALABRAS, k=12)),
+                )
+                for _ in range(min(chunk_size, count - start))
+            ]
+            with transaction.atomic():
+                Autor.objects.bulk_create(autores)
+                if self.log_changes:
+                    registrar_creados(autores)
+            ids.extend(autor.pk for autor in autores)
+        return ids
+
+    def seed_libros(self, rng, count, fanout, autor_ids, chunk_size):
+        Through = Libro.autores.through
+        # Continue after the highest ISBN this command has issued so reruns don't collide.
+        # Only well-formed ISBN-13s: "9799" or "97912" would skew Max("isbn").
+        last = Libro.objects.filter(isbn__regex=rf"^{ISBN_PREFIX}\d{{10}}$").aggregate(
+            last=Max("isbn")
+        )["last"]
+        serial = int(last[len(ISBN_PREFIX) : -1]) + 1 if last else 0
+        enlaces = 0
+        for start in range(0, count, chunk_size):
+            libros = []
+            for _ in range(min(chunk_size, count - start)):
+                libros.append(
+                    Libro(
+                        titulo=" ".join(
+                            rng.choices(PALABRAS, k=rng.randint(2, 5))
+                        ).capitalize(),
+                        fecha_publicacion=EPOCH + timedelta(days=rng.randrange(DAYS)),
+                        isbn=isbn13(ISBN_PREFIX, serial),
+                        descripcion=" ".join(rng.choices(PALABRAS, k=20)),
+                        paginas=rng.randint(50, 1200),
+                    )
+                )
+                serial += 1
+            with transaction.atomic():
+                Libro.objects.bulk_create(libros)
+                if self.log_changes:
+                    registrar_creados(libros)
+                if fanout:
+                    links = [
+                        Through(libro_id=libro.pk, autor_id=autor_id)
+                        for libro in libros
+                        for autor_id in rng.sample(
+                            autor_ids, min(rng.randint(1, fanout), len(autor_ids))
+                        )
+                    ]
+                    Through.objects.bulk_create(links)
+                    if self.log_changes:
+                        registrar_enlaces(
+                            [(link.libro_id, link.autor_id) for link in links],
+                            Cambio.Accion.CREATE,
+                        )
+                    enlaces += len(links)
+        return count, enlaces
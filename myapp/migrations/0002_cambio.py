@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-19 15:01
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Compactacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hasta', models.BigIntegerField()),
+                ('fecha', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Compactaciones',
+            },
+        ),
+        migrations.CreateModel(
+            name='Cambio',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('modelo', models.CharField(choices=[('autor', 'Autor'), ('libro', 'Libro'), ('libro_autor', 'Libro Autor')], max_length=20)),
+                ('objeto_id', models.BigIntegerField()),
+                ('relacionado_id', models.BigIntegerField(blank=True, null=True)),
+                ('accion', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('delete', 'Delete')], max_length=10)),
+                ('datos', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('fecha', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Cambios',
+                'indexes': [models.Index(fields=['modelo', 'objeto_id', 'relacionado_id'], name='myapp_cambi_modelo_193a9f_idx')],
+            },
+        ),
+    ]
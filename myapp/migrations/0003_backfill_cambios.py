@@ -0,0 +1,66 @@
+from django.db import migrations
+from django.forms.models import model_to_dict
+
+CHUNK_SIZE = 2000
+# Same key as myapp.signals.CAMBIO_LOCK_KEY.
+CAMBIO_LOCK_KEY = 0x43414D42494F
+
+
+def chunks(queryset):
+    # Keyset pagination so memory stays flat on large tables.
+    last = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last).order_by("pk")[:CHUNK_SIZE])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1].pk
+
+
+def backfill(apps, schema_editor):
+    """Log a ``create`` for every row and link that predates the change feed."""
+    Autor = apps.get_model("myapp", "Autor")
+    Libro = apps.get_model("myapp", "Libro")
+    Cambio = apps.get_model("myapp", "Cambio")
+    Through = Libro.autores.through
+    db = schema_editor.connection.alias
+
+    if schema_editor.connection.vendor == "postgresql":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CAMBIO_LOCK_KEY])
+
+    for model, modelo in ((Autor, "autor"), (Libro, "libro")):
+        for chunk in chunks(model.objects.using(db)):
+            Cambio.objects.using(db).bulk_create(
+                Cambio(
+                    modelo=modelo,
+                    objeto_id=instance.pk,
+                    accion="create",
+                    datos={
+                        "id": instance.pk,
+                        **model_to_dict(instance, exclude=["id", "autores"]),
+                    },
+                )
+                for instance in chunk
+            )
+    for chunk in chunks(Through.objects.using(db)):
+        Cambio.objects.using(db).bulk_create(
+            Cambio(
+                modelo="libro_autor",
+                objeto_id=link.libro_id,
+                relacionado_id=link.autor_id,
+                accion="create",
+            )
+            for link in chunk
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0002_cambio"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 # Create your models here.
@@ -29,3 +30,50 @@ class Libro(models.Model):
 
     class Meta:
         verbose_name_plural = "Libros"
+
+
+class Cambio(models.Model):
+    """
+    Append-only change log entry for `/api/changes/`. ``datos`` holds a
+    snapshot of the row after the change and is null for deletions
+    (tombstones). ``libro_autor`` entries record ``Libro.autores`` links, with
+    the book in ``objeto_id`` and the author in ``relacionado_id``.
+    """
+
+    class Modelo(models.TextChoices):
+        AUTOR = "autor"
+        LIBRO = "libro"
+        LIBRO_AUTOR = "libro_autor"
+
+    class Accion(models.TextChoices):
+        CREATE = "create"
+        UPDATE = "update"
+        DELETE = "delete"
+
+    seq = models.BigAutoField(primary_key=True)
+    modelo = models.CharField(max_length=20, choices=Modelo.choices)
+    objeto_id = models.BigIntegerField()
+    relacionado_id = models.BigIntegerField(null=True, blank=True)
+    accion = models.CharField(max_length=10, choices=Accion.choices)
+    datos = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    fecha = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"#{self.seq} {self.accion} {self.modelo} {self.objeto_id}"
+
+    class Meta:
+        verbose_name_plural = "Cambios"
+        indexes = [models.Index(fields=["modelo", "objeto_id", "relacionado_id"])]
+
+
+class Compactacion(models.Model):
+    """Run of ``compact_changes``; ``hasta`` is the newest tombstone it dropped."""
+
+    hasta = models.BigIntegerField()
+    fecha = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Compactación hasta #{self.hasta}"
+
+    class Meta:
+        verbose_name_plural = "Compactaciones"
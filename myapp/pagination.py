@@ -0,0 +1,59 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class SeqPagination(BasePagination):
+    """
+    Keyset pagination over a monotonically increasing ``seq`` column: each page
+    holds up to ``limit`` rows with ``seq > since`` and links to the next page
+    with ``since`` set to the last ``seq`` returned.
+    """
+
+    since_query_param = "since"
+    limit_query_param = "limit"
+    default_limit = 500
+    max_limit = 5000
+
+    def get_since(self, request):
+        return self._get_int(request, self.since_query_param, 0)
+
+    def get_limit(self, request):
+        limit = self._get_int(request, self.limit_query_param, self.default_limit)
+        return min(max(limit, 1), self.max_limit)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.since = self.get_since(request)
+        limit = self.get_limit(request)
+        page = list(queryset.filter(seq__gt=self.since).order_by("seq")[: limit + 1])
+        self.has_next = len(page) > limit
+        page = page[:limit]
+        self.next_since = page[-1].seq if page else self.since
+        return page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "since": self.since,
+                "next_since": self.next_since,
+                "next": self.get_next_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.since_query_param, self.next_since)
+
+    def _get_int(self, request, param, default):
+        value = request.query_params.get(param)
+        if value in (None, ""):
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError({param: ["A valid integer is required."]})
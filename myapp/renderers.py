@@ -0,0 +1,19 @@
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    # Coerce dates, decimals, UUIDs, etc. exactly as JSONRenderer does.
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(
+            data, default=self.encoder_class().default, use_bin_type=True
+        )
@@ -1,6 +1,23 @@
 from rest_framework import serializers
 
-from .models import Autor, Libro
+from .models import Autor, Cambio, Libro
+from .signals import registrar_creados
+
+ISBN_EXISTS = "libro with this isbn already exists."
+
+
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """Insert all validated items with ``bulk_create`` instead of one save per item."""
+
+    batch_size = 1000
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        instances = model.objects.bulk_create(
+            [model(**attrs) for attrs in validated_data], batch_size=self.batch_size
+        )
+        registrar_creados(instances, batch_size=self.batch_size)
+        return instances
 
 
 class AutorSerializer(serializers.ModelSerializer):
@@ -8,6 +25,7 @@ class AutorSerializer(serializers.ModelSerializer):
         model = Autor
         fields = "__all__"
         read_only_fields = ["id"]
+        list_serializer_class = BulkCreateListSerializer
 
 
 class LibroSerializer(serializers.ModelSerializer):
@@ -17,3 +35,63 @@ class LibroSerializer(serializers.ModelSerializer):
         model = Libro
         fields = "__all__"
         read_only_fields = ["id"]
+
+
+class LibroListSerializer(BulkCreateListSerializer):
+    def to_internal_value(self, data):
+        validated = super().to_internal_value(data)
+        # One query for the whole batch instead of a UniqueValidator SELECT per item.
+        isbns = [item["isbn"] for item in validated]
+        existing = set(
+            Libro.objects.filter(isbn__in=isbns).values_list("isbn", flat=True)
+        )
+        seen, errors = set(), []
+        for isbn in isbns:
+            if isbn in existing:
+                errors.append({"isbn": [ISBN_EXISTS]})
+            elif isbn in seen:
+                errors.append({"isbn": ["Repeated isbn in batch."]})
+            else:
+                errors.append({})
+            seen.add(isbn)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return validated
+
+    def create(self, validated_data):
+        libros = super().create(validated_data)
+        for libro in libros:
+            libro._prefetched_objects_cache = {"autores": Autor.objects.none()}
+        return libros
+
+
+class LibroWriteSerializer(LibroSerializer):
+    """
+    `LibroSerializer` without the per-request ``isbn`` uniqueness query. The
+    database constraint is authoritative; views map its ``IntegrityError`` to
+    a 400 (see ``myapp.views.unique_isbn``).
+    """
+
+    class Meta(LibroSerializer.Meta):
+        extra_kwargs = {"isbn": {"validators": []}}
+        list_serializer_class = LibroListSerializer
+
+    def create(self, validated_data):
+        libro = super().create(validated_data)
+        # `autores` is read-only, so a new libro has none; skip the SELECT.
+        libro._prefetched_objects_cache = {"autores": Autor.objects.none()}
+        return libro
+
+
+class CambioSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Cambio
+        fields = [
+            "seq",
+            "modelo",
+            "objeto_id",
+            "relacionado_id",
+            "accion",
+            "datos",
+            "fecha",
+        ]
@@ -0,0 +1,110 @@
+"""
+Change log writers for `Cambio`. Receivers cover ``save()``, ``delete()`` and
+``Libro.autores`` changes; ``bulk_create`` sends no signals, so bulk paths
+call `registrar_creados`/`registrar_enlaces` themselves. Rows removed by
+cascade (e.g. links of a deleted libro or autor) are not logged: a tombstone
+implies them.
+
+Every write goes through `guardar_cambios`, which makes log entries commit in
+``seq`` order (see its docstring).
+"""
+
+from django.db import connection, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.forms.models import model_to_dict
+
+from .models import Autor, Cambio, Libro
+
+MODELOS = {Autor: Cambio.Modelo.AUTOR, Libro: Cambio.Modelo.LIBRO}
+# Key for pg_advisory_xact_lock; any value no other code locks on ("CAMBIO").
+CAMBIO_LOCK_KEY = 0x43414D42494F
+
+
+def guardar_cambios(cambios, batch_size=None):
+    """
+    Insert ``cambios`` so that log entries commit in ``seq`` order.
+
+    PostgreSQL hands out ``seq`` at insert time, so without this a transaction
+    could commit seq 11 while seq 10 is still open, and a reader at
+    ``since=9`` would skip 10 for good. A transaction-scoped advisory lock is
+    taken before allocating any ``seq`` and held until the enclosing
+    transaction ends, so log writers commit one after another. SQLite already
+    serializes writers with its database lock.
+    """
+    with transaction.atomic(savepoint=False):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CAMBIO_LOCK_KEY])
+        Cambio.objects.bulk_create(cambios, batch_size=batch_size)
+
+
+def cambio(instance, accion):
+    datos = None
+    if accion != Cambio.Accion.DELETE:
+        datos = {
+            "id": instance.pk,
+            **model_to_dict(instance, exclude=["id", "autores"]),
+        }
+    return Cambio(
+        modelo=MODELOS[type(instance)],
+        objeto_id=instance.pk,
+        accion=accion,
+        datos=datos,
+    )
+
+
+def registrar_creados(instances, batch_size=None):
+    """Log creates for rows inserted with ``bulk_create``."""
+    guardar_cambios(
+        [cambio(instance, Cambio.Accion.CREATE) for instance in instances],
+        batch_size=batch_size,
+    )
+
+
+def registrar_enlaces(pares, accion, batch_size=None):
+    """Log ``Libro.autores`` links given as ``(libro_id, autor_id)`` pairs."""
+    guardar_cambios(
+        [
+            Cambio(
+                modelo=Cambio.Modelo.LIBRO_AUTOR,
+                objeto_id=libro_id,
+                relacionado_id=autor_id,
+                accion=accion,
+            )
+            for libro_id, autor_id in pares
+        ],
+        batch_size=batch_size,
+    )
+
+
+@receiver(post_save, sender=Autor)
+@receiver(post_save, sender=Libro)
+def registrar_guardado(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    accion = Cambio.Accion.CREATE if created else Cambio.Accion.UPDATE
+    guardar_cambios([cambio(instance, accion)])
+
+
+@receiver(post_delete, sender=Autor)
+@receiver(post_delete, sender=Libro)
+def registrar_borrado(sender, instance, **kwargs):
+    guardar_cambios([cambio(instance, Cambio.Accion.DELETE)])
+
+
+@receiver(m2m_changed, sender=Libro.autores.through)
+def registrar_autores(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        relacionados = instance.libros if reverse else instance.autores
+        instance._enlaces_borrados = set(relacionados.values_list("pk", flat=True))
+        return
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_enlaces_borrados", set())
+    elif action not in ("post_add", "post_remove"):
+        return
+    accion = Cambio.Accion.CREATE if action == "post_add" else Cambio.Accion.DELETE
+    registrar_enlaces(
+        [(pk, instance.pk) if reverse else (instance.pk, pk) for pk in sorted(pk_set)],
+        accion,
+    )
@@ -0,0 +1,197 @@
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from myapp.models import Autor, Cambio, Libro
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def autor():
+    return Autor.objects.create(nombre="Gabriel", apellido="García Márquez")
+
+
+@pytest.fixture
+def libro():
+    return Libro.objects.create(
+        titulo="Cien años de soledad",
+        fecha_publicacion=date(1967, 5, 30),
+        isbn="9780307474728",
+        paginas=417,
+    )
+
+
+def cambios():
+    return list(
+        Cambio.objects.order_by("seq").values_list(
+            "modelo", "accion", "objeto_id", "relacionado_id"
+        )
+    )
+
+
+def compactar(**options):
+    call_command("compact_changes", stdout=StringIO(), **options)
+
+
+@pytest.mark.django_db
+class TestRegistroCambios:
+    def test_create_update_delete(self, autor):
+        autor.nombre = "Gabriel José"
+        autor.save()
+        autor_id = autor.id
+        autor.delete()
+        assert cambios() == [
+            ("autor", "create", autor_id, None),
+            ("autor", "update", autor_id, None),
+            ("autor", "delete", autor_id, None),
+        ]
+        create, update, delete = Cambio.objects.order_by("seq")
+        assert update.datos["nombre"] == "Gabriel José"
+        assert delete.datos is None
+
+    def test_snapshot_libro(self, libro):
+        datos = Cambio.objects.get(modelo="libro").datos
+        assert datos["id"] == libro.id
+        assert datos["isbn"] == "9780307474728"
+        assert datos["fecha_publicacion"] == "1967-05-30"
+        assert "autores" not in datos
+
+    def test_enlaces(self, autor, libro):
+        Cambio.objects.all().delete()
+        otro = Autor.objects.create(nombre="Julio", apellido="Cortázar")
+        libro.autores.add(autor, otro)
+        libro.autores.remove(autor)
+        otro.libros.clear()
+        assert cambios()[1:] == [
+            ("libro_autor", "create", libro.id, autor.id),
+            ("libro_autor", "create", libro.id, otro.id),
+            ("libro_autor", "delete", libro.id, autor.id),
+            ("libro_autor", "delete", libro.id, otro.id),
+        ]
+
+    def test_bulk_create(self, api_client):
+        url = reverse("autor-bulk")
+        data = [{"nombre": f"Autor {i}", "apellido": "Apellido"} for i in range(3)]
+        response = api_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [c[:3] for c in cambios()] == [
+            ("autor", "create", a["id"]) for a in response.data
+        ]
+
+    def test_seed_catalogue(self):
+        call_command("seed_catalogue", autores=3, libros=5, fanout=2, stdout=StringIO())
+        assert Cambio.objects.filter(modelo="autor").count() == 3
+        assert Cambio.objects.filter(modelo="libro").count() == 5
+        enlaces = Libro.autores.through.objects.count()
+        assert Cambio.objects.filter(modelo="libro_autor").count() == enlaces
+
+
+@pytest.mark.django_db
+class TestChangesEndpoint:
+    def test_paginacion(self, api_client):
+        for i in range(5):
+            Autor.objects.create(nombre=f"Autor {i}", apellido="Apellido")
+        url = reverse("cambio-list")
+        response = api_client.get(url, {"limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 2
+        assert response.data["next"] is not None
+
+        vistos = [c["seq"] for c in response.data["results"]]
+        since = response.data["next_since"]
+        while True:
+            response = api_client.get(url, {"since": since, "limit": 2})
+            vistos += [c["seq"] for c in response.data["results"]]
+            since = response.data["next_since"]
+            if response.data["next"] is None:
+                break
+        assert vistos == list(
+            Cambio.objects.order_by("seq").values_list("seq", flat=True)
+        )
+
+    def test_sin_cambios_nuevos(self, api_client, autor):
+        seq = Cambio.objects.get().seq
+        response = api_client.get(reverse("cambio-list"), {"since": seq})
+        assert response.data["results"] == []
+        assert response.data["next_since"] == seq
+        assert response.data["next"] is None
+
+    def test_since_invalido(self, api_client):
+        response = api_client.get(reverse("cambio-list"), {"since": "abc"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_since_compactado(self, api_client, autor):
+        otro = Autor.objects.create(nombre="Julio", apellido="Cortázar")
+        otro.delete()
+        tombstone = Cambio.objects.get(accion="delete").seq
+        Cambio.objects.update(fecha=timezone.now() - timedelta(days=60))
+        compactar(retention_days=30)
+        url = reverse("cambio-list")
+        response = api_client.get(url, {"since": tombstone - 1})
+        assert response.status_code == status.HTTP_410_GONE
+        assert response.data["horizon"] == tombstone
+        assert response.data["last_seq"] == Cambio.objects.get().seq
+        response = api_client.get(url, {"since": tombstone})
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.parametrize("params", [{"since": 0}, {}])
+    def test_bootstrap_tras_compactar(self, api_client, autor, params):
+        otro = Autor.objects.create(nombre="Julio", apellido="Cortázar")
+        otro.delete()
+        Cambio.objects.update(fecha=timezone.now() - timedelta(days=60))
+        compactar(retention_days=30)
+        response = api_client.get(reverse("cambio-list"), params)
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            (c["modelo"], c["accion"], c["objeto_id"]) for c in response.data["results"]
+        ] == [("autor", "create", autor.id)]
+
+
+@pytest.mark.django_db
+class TestCompactChanges:
+    def test_conserva_ultimo_estado(self, autor, libro):
+        libro.autores.add(autor)
+        libro.titulo = "Cien años"
+        libro.save()
+        libro.autores.remove(autor)
+        Cambio.objects.update(fecha=timezone.now() - timedelta(days=60))
+        compactar(retention_days=30)
+        assert cambios() == [
+            ("autor", "create", autor.id, None),
+            ("libro", "update", libro.id, None),
+        ]
+
+    def test_borra_enlaces_de_filas_borradas(self, autor, libro):
+        otro = Autor.objects.create(nombre="Julio", apellido="Cortázar")
+        otro_libro = Libro.objects.create(
+            titulo="Rayuela",
+            fecha_publicacion=date(1963, 6, 28),
+            isbn="9788437604572",
+            paginas=736,
+        )
+        libro.autores.add(autor)
+        otro_libro.autores.add(autor, otro)
+        libro.delete()
+        otro.delete()
+        Cambio.objects.update(fecha=timezone.now() - timedelta(days=60))
+        compactar(retention_days=30)
+        assert cambios() == [
+            ("autor", "create", autor.id, None),
+            ("libro", "create", otro_libro.id, None),
+            ("libro_autor", "create", otro_libro.id, autor.id),
+        ]
+
+    def test_respeta_retencion(self, autor):
+        autor.delete()
+        compactar(retention_days=30)
+        assert len(cambios()) == 2
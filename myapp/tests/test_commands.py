@@ -0,0 +1,70 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from myapp.management.commands.seed_catalogue import isbn13
+from myapp.models import Autor, Libro
+
+
+def seed(**options):
+    out = StringIO()
+    call_command("seed_catalogue", stdout=out, **options)
+    return out.getvalue()
+
+
+def isbn_valido(isbn):
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(isbn))
+    return len(isbn) == 13 and isbn.isdigit() and total % 10 == 0
+
+
+def test_isbn13():
+    assert isbn13("978", 30747472) == "9780307474728"
+    assert isbn_valido(isbn13("979", 123456789))
+
+
+@pytest.mark.django_db
+class TestSeedCatalogue:
+    def test_crea_filas(self):
+        out = seed(autores=20, libros=150, fanout=3, chunk_size=40)
+        assert Autor.objects.count() == 20
+        assert Libro.objects.count() == 150
+        assert "rows/s" in out
+
+    def test_isbn_validos_y_unicos(self):
+        seed(autores=5, libros=100, chunk_size=30)
+        seed(autores=0, libros=100, chunk_size=30)
+        isbns = list(Libro.objects.values_list("isbn", flat=True))
+        assert len(set(isbns)) == 200
+        assert all(isbn_valido(isbn) for isbn in isbns)
+
+    def test_ignora_isbn_mal_formados(self):
+        for isbn in ("9799", "97912"):
+            Libro.objects.create(
+                titulo=isbn, fecha_publicacion="2000-01-01", isbn=isbn, paginas=1
+            )
+        seed(autores=1, libros=10)
+        seed(autores=0, libros=10)
+        assert Libro.objects.count() == 22
+
+    def test_fanout(self):
+        seed(autores=10, libros=50, fanout=2)
+        for libro in Libro.objects.prefetch_related("autores"):
+            assert 1 <= len(libro.autores.all()) <= 2
+
+    def test_determinista(self):
+        seed(autores=5, libros=20, seed=7)
+        primero = list(
+            Libro.objects.order_by("id").values_list("titulo", "isbn", "paginas")
+        )
+        Libro.objects.all().delete()
+        Autor.objects.all().delete()
+        seed(autores=5, libros=20, seed=7)
+        segundo = list(
+            Libro.objects.order_by("id").values_list("titulo", "isbn", "paginas")
+        )
+        assert primero == segundo
+
+    def test_sin_autores(self):
+        with pytest.raises(CommandError):
+            seed(autores=0, libros=10)
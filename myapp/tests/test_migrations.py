@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+ANTES = [("myapp", "0002_cambio")]
+DESPUES = [("myapp", "0003_backfill_cambios")]
+
+
+def migrar(destino):
+    executor = MigrationExecutor(connection)
+    executor.loader.build_graph()
+    executor.migrate(destino)
+    return executor.loader.project_state(destino).apps
+
+
+@pytest.mark.django_db(transaction=True)
+def test_backfill_cambios():
+    apps = migrar(ANTES)
+    Autor = apps.get_model("myapp", "Autor")
+    Libro = apps.get_model("myapp", "Libro")
+    # Historical models send no signals, so these rows start unlogged.
+    autor = Autor.objects.create(nombre="Gabriel", apellido="García Márquez")
+    libro = Libro.objects.create(
+        titulo="Cien años de soledad",
+        fecha_publicacion=date(1967, 5, 30),
+        isbn="9780307474728",
+        paginas=417,
+    )
+    libro.autores.add(autor)
+    assert apps.get_model("myapp", "Cambio").objects.count() == 0
+
+    try:
+        Cambio = migrar(DESPUES).get_model("myapp", "Cambio")
+        cambios = list(
+            Cambio.objects.order_by("seq").values_list(
+                "modelo", "accion", "objeto_id", "relacionado_id"
+            )
+        )
+        assert cambios == [
+            ("autor", "create", autor.id, None),
+            ("libro", "create", libro.id, None),
+            ("libro_autor", "create", libro.id, autor.id),
+        ]
+        datos = Cambio.objects.get(modelo="libro").datos
+        assert datos["id"] == libro.id
+        assert datos["fecha_publicacion"] == "1967-05-30"
+    finally:
+        migrar(MigrationExecutor(connection).loader.graph.leaf_nodes())
@@ -0,0 +1,128 @@
+import gzip
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+
+import msgpack
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from myapp.models import Autor, Libro
+from myapp.parsers import MessagePackParser
+from myapp.renderers import MessagePackRenderer
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def autor():
+    return Autor.objects.create(nombre="Gabriel", apellido="García Márquez")
+
+
+@pytest.fixture
+def libros(autor):
+    libros = Libro.objects.bulk_create(
+        Libro(
+            titulo=f"Libro {i}",
+            fecha_publicacion=date(1967, 5, 30),
+            isbn=f"{9780000000000 + i}",
+            descripcion="Una obra maestra de la literatura latinoamericana",
+            paginas=417,
+        )
+        for i in range(50)
+    )
+    autor.libros.add(*libros)
+    return libros
+
+
+class TestMessagePack:
+    def test_round_trip(self):
+        data = {
+            "titulo": "Cien años de soledad",
+            "fecha_publicacion": date(1967, 5, 30),
+        }
+        content = MessagePackRenderer().render(data)
+        parsed = msgpack.unpackb(content, raw=False)
+        assert parsed == {
+            "titulo": "Cien años de soledad",
+            "fecha_publicacion": "1967-05-30",
+        }
+
+    def test_coercion_igual_que_json(self):
+        data = {
+            "fecha": datetime(2025, 4, 15, 19, 37, 1, 123456, tzinfo=timezone.utc),
+            "precio": Decimal("9.90"),
+        }
+        parsed = msgpack.unpackb(MessagePackRenderer().render(data), raw=False)
+        assert parsed == json.loads(JSONRenderer().render(data))
+        assert parsed["fecha"].endswith("Z")
+
+    def test_parse_error(self):
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(BytesIO(b"\xc1"))
+
+
+@pytest.mark.django_db
+class TestMessagePackNegotiation:
+    def test_list_libros_msgpack(self, api_client, libros):
+        url = reverse("libro-list")
+        response = api_client.get(url, HTTP_ACCEPT="application/msgpack")
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/msgpack"
+        data = msgpack.unpackb(response.content, raw=False)
+        assert len(data) == len(libros)
+        assert data[0]["autores"][0]["nombre"] == "Gabriel"
+
+    def test_format_suffix_query(self, api_client, libros):
+        url = reverse("libro-list")
+        response = api_client.get(url, {"format": "msgpack"})
+        assert response["Content-Type"] == "application/msgpack"
+
+    def test_create_autor_msgpack(self, api_client):
+        url = reverse("autor-list")
+        response = api_client.post(
+            url, {"nombre": "Julio", "apellido": "Cortázar"}, format="msgpack"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Autor.objects.get().apellido == "Cortázar"
+
+
+@pytest.mark.django_db
+class TestAPIGZip:
+    def test_large_response_gzipped(self, api_client, libros):
+        url = reverse("libro-list")
+        response = api_client.get(
+            url, HTTP_ACCEPT="application/json", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert len(json.loads(gzip.decompress(response.content))) == len(libros)
+
+    def test_without_accept_encoding(self, api_client, libros):
+        url = reverse("libro-list")
+        response = api_client.get(url, HTTP_ACCEPT="application/json")
+        assert not response.has_header("Content-Encoding")
+
+    @override_settings(API_GZIP_MIN_LENGTH=10**6)
+    def test_below_threshold_not_gzipped(self, api_client, libros):
+        url = reverse("libro-list")
+        response = api_client.get(
+            url, HTTP_ACCEPT="application/json", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        assert not response.has_header("Content-Encoding")
+
+    def test_browsable_api_not_gzipped(self, api_client, libros):
+        url = reverse("libro-list")
+        response = api_client.get(
+            url, HTTP_ACCEPT="text/html", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        assert not response.has_header("Content-Encoding")
@@ -1,11 +1,14 @@
 from datetime import date
 
 import pytest
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from myapp.models import Autor, Libro
+from myapp.views import unique_isbn
 
 
 @pytest.fixture
@@ -122,3 +125,123 @@ class TestLibroViewSet:
         response = api_client.delete(url)
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert Libro.objects.count() == 0
+
+
+def _statements(queries, verb):
+    # Change log writes (myapp_cambio, plus the PostgreSQL advisory lock that
+    # orders them) are covered in test_changes.py.
+    return [
+        q["sql"]
+        for q in queries
+        if q["sql"].lstrip().upper().startswith(verb)
+        and "myapp_cambio" not in q["sql"]
+        and "pg_advisory_xact_lock" not in q["sql"]
+    ]
+
+
+@pytest.fixture
+def libros_data(libro_data):
+    return [
+        {**libro_data, "titulo": f"Libro {i}", "isbn": f"{9780000000000 + i}"}
+        for i in range(50)
+    ]
+
+
+@pytest.mark.django_db
+class TestLibroWritePath:
+    def test_create_libro_isbn_duplicado(self, api_client, libro_data):
+        Libro.objects.create(**libro_data)
+        url = reverse("libro-list")
+        response = api_client.post(url, libro_data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "isbn" in response.data
+        assert Libro.objects.count() == 1
+
+    def test_update_libro_isbn_duplicado(self, api_client, libro_data):
+        Libro.objects.create(**libro_data)
+        libro = Libro.objects.create(**{**libro_data, "isbn": "9780060883287"})
+        url = reverse("libro-detail", args=[libro.id])
+        response = api_client.patch(url, {"isbn": libro_data["isbn"]}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "isbn" in response.data
+
+    def test_otros_integrity_error_no_son_isbn(self):
+        with pytest.raises(IntegrityError):
+            with unique_isbn():
+                raise IntegrityError("FOREIGN KEY constraint failed")
+
+    def test_create_libro_sin_select_de_unicidad(self, api_client, libro_data):
+        url = reverse("libro-list")
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(url, libro_data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(_statements(ctx.captured_queries, "INSERT")) == 1
+        assert _statements(ctx.captured_queries, "SELECT") == []
+        assert response.data["autores"] == []
+
+    def test_update_libro_sin_select_de_unicidad(self, api_client, libro_data):
+        libro = Libro.objects.create(**libro_data)
+        url = reverse("libro-detail", args=[libro.id])
+        updated_data = {**libro_data, "titulo": "El amor en los tiempos del cólera"}
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.put(url, updated_data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(_statements(ctx.captured_queries, "UPDATE")) == 1
+        # get_object() plus the nested `autores` lookup for the response.
+        assert len(_statements(ctx.captured_queries, "SELECT")) == 2
+
+
+@pytest.mark.django_db
+class TestBulkCreate:
+    def test_bulk_create_libros(self, api_client, libros_data):
+        url = reverse("libro-bulk")
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(url, libros_data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data) == len(libros_data)
+        assert all(item["id"] and item["autores"] == [] for item in response.data)
+        assert Libro.objects.count() == len(libros_data)
+        assert len(_statements(ctx.captured_queries, "INSERT")) == 1
+        # Only the isbn pre-query for the batch.
+        assert len(_statements(ctx.captured_queries, "SELECT")) == 1
+
+    def test_bulk_create_isbn_existente(self, api_client, libros_data):
+        Libro.objects.create(**libros_data[3])
+        url = reverse("libro-bulk")
+        response = api_client.post(url, libros_data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "isbn" in response.data[3]
+        assert [i for i, errores in enumerate(response.data) if errores] == [3]
+        assert Libro.objects.count() == 1
+
+    def test_bulk_create_isbn_repetido_en_lote(self, api_client, libros_data):
+        libros_data[1]["isbn"] = libros_data[0]["isbn"]
+        url = reverse("libro-bulk")
+        response = api_client.post(url, libros_data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [i for i, errores in enumerate(response.data) if errores] == [1]
+        assert "isbn" in response.data[1]
+        assert Libro.objects.count() == 0
+
+    def test_bulk_create_item_invalido(self, api_client, libros_data):
+        libros_data[2]["paginas"] = -1
+        url = reverse("libro-bulk")
+        response = api_client.post(url, libros_data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "paginas" in response.data[2]
+        assert Libro.objects.count() == 0
+
+    def test_bulk_create_vacio(self, api_client):
+        url = reverse("libro-bulk")
+        response = api_client.post(url, [], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_create_autores(self, api_client, autor_data):
+        url = reverse("autor-bulk")
+        data = [{**autor_data, "nombre": f"Autor {i}"} for i in range(20)]
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Autor.objects.count() == 20
+        assert len(_statements(ctx.captured_queries, "INSERT")) == 1
+        assert _statements(ctx.captured_queries, "SELECT") == []
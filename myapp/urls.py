@@ -1,11 +1,12 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import AutorViewSet, LibroViewSet
+from .views import AutorViewSet, CambioViewSet, LibroViewSet
 
 router = DefaultRouter()
 router.register(r"autors", AutorViewSet)
 router.register(r"libros", LibroViewSet)
+router.register(r"changes", CambioViewSet)
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -1,15 +1,136 @@
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+from django.db.models import Max
 from django.shortcuts import render
-from rest_framework import viewsets
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .models import Autor, Cambio, Compactacion, Libro
+from .pagination import SeqPagination
+from .serializers import (
+    AutorSerializer,
+    CambioSerializer,
+    LibroSerializer,
+    ISBN_EXISTS,
+    LibroWriteSerializer,
+)
+
+
+@contextmanager
+def unique_isbn():
+    """Run the enclosed writes atomically, reporting an ``isbn`` clash as a 400."""
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as exc:
+        # SQLite: "UNIQUE constraint failed: myapp_libro.isbn"; PostgreSQL:
+        # 'duplicate key value violates unique constraint "myapp_libro_isbn_key"'.
+        message = str(exc).lower()
+        if "unique" not in message or "isbn" not in message:
+            raise
+        raise ValidationError({"isbn": [ISBN_EXISTS]})
+
 
-from .models import Autor, Libro
-from .serializers import AutorSerializer, LibroSerializer
+class BulkCreateMixin:
+    """
+    Adds ``POST <list-url>/bulk/``, which validates a list of objects and
+    inserts them in a single transaction with ``bulk_create``.
+    """
 
+    bulk_max_length = 1000
 
-class AutorViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.bulk_max_length,
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_bulk_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_bulk_create(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+
+class AutorViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     queryset = Autor.objects.all()
     serializer_class = AutorSerializer
 
+    # Keep the row and its change log entry in one transaction.
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
 
-class LibroViewSet(viewsets.ModelViewSet):
+class LibroViewSet(BulkCreateMixin, viewsets.ModelViewSet):
     queryset = Libro.objects.all()
     serializer_class = LibroSerializer
+
+    def get_serializer_class(self):
+        if self.action in ("create", "update", "partial_update", "bulk"):
+            return LibroWriteSerializer
+        return super().get_serializer_class()
+
+    def perform_create(self, serializer):
+        with unique_isbn():
+            serializer.save()
+
+    def perform_update(self, serializer):
+        with unique_isbn():
+            serializer.save()
+
+    def perform_bulk_create(self, serializer):
+        with unique_isbn():
+            serializer.save()
+
+
+class CambioViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Change feed for incremental sync: ``GET /api/changes/?since=<seq>&limit=<n>``
+    returns entries after ``since`` in ``seq`` order. Clients store
+    ``next_since`` and apply each entry as an upsert (or delete for tombstones);
+    deleting an autor/libro also removes its links.
+
+    New replicas start from ``since=0`` (or no ``since``): compaction keeps the
+    latest entry for every live row, so the log from 0 is always a complete
+    snapshot. Any other ``since`` older than the last compacted tombstone gets
+    a 410 whose body carries the ``horizon`` and the current ``last_seq``; the
+    client drops its copy and restarts from ``since=0``.
+
+    Entries commit in ``seq`` order (``myapp.signals.guardar_cambios``), so once
+    an entry is visible every entry with a lower ``seq`` is visible too and
+    paging by ``next_since`` never skips a change. The price is that writes
+    which log changes commit one at a time; a long ``seed_catalogue`` chunk
+    holds API writes back until it commits.
+    """
+
+    queryset = Cambio.objects.all()
+    serializer_class = CambioSerializer
+    pagination_class = SeqPagination
+
+    def list(self, request, *args, **kwargs):
+        since = self.paginator.get_since(request)
+        if since:
+            horizonte = Compactacion.objects.aggregate(hasta=Max("hasta"))["hasta"]
+            if horizonte is not None and since < horizonte:
+                return Response(
+                    {
+                        "detail": "Changes since this sequence were compacted; "
+                        "restart from since=0.",
+                        "horizon": horizonte,
+                        "last_seq": Cambio.objects.aggregate(seq=Max("seq"))["seq"],
+                    },
+                    status=status.HTTP_410_GONE,
+                )
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """
+    Compress API responses above ``API_GZIP_MIN_LENGTH`` bytes when the client
+    sends ``Accept-Encoding: gzip``. HTML pages (admin, browsable API forms)
+    carry CSRF tokens and are left alone to avoid BREACH-style attacks.
+    """
+
+    def process_response(self, request, response):
+        if not request.path.startswith("/api/"):
+            return response
+        if response.get("Content-Type", "").startswith("text/html"):
+            return response
+        if (
+            not response.streaming
+            and len(response.content) < settings.API_GZIP_MIN_LENGTH
+        ):
+            return response
+        return super().process_response(request, response)
@@ -55,6 +55,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "myproject.middleware.APIGZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -83,6 +84,33 @@ TEMPLATES = [
 WSGI_APPLICATION = "myproject.wsgi.application"
 
 
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+        "myapp.renderers.MessagePackRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+        "myapp.parsers.MessagePackParser",
+    ],
+    "TEST_REQUEST_RENDERER_CLASSES": [
+        "rest_framework.renderers.MultiPartRenderer",
+        "rest_framework.renderers.JSONRenderer",
+        "myapp.renderers.MessagePackRenderer",
+    ],
+}
+
+# API responses at least this many bytes long are gzipped when the client
+# sends `Accept-Encoding: gzip` (see myproject.middleware.APIGZipMiddleware).
+API_GZIP_MIN_LENGTH = int(os.environ.get("API_GZIP_MIN_LENGTH") or 1024)
+
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 